@@ -35,24 +35,24 @@ def check_gn_flags(gn_flags_path):
     keys_seen = set()
     warnings = False
     with gn_flags_path.open(encoding=ENCODING) as file_obj:
-        iterator = iter(file_obj.read().splitlines())
-    try:
-        previous = next(iterator)
-    except StopIteration:
-        return warnings
-    for current in iterator:
-        gn_key = current.split('=')[0]
-        if gn_key in keys_seen:
-            get_logger().warning('In GN flags %s, "%s" appears at least twice', gn_flags_path,
-                                 gn_key)
-            warnings = True
-        else:
-            keys_seen.add(gn_key)
-        if current < previous:
-            get_logger().warning('In GN flags %s, "%s" should be sorted before "%s"', gn_flags_path,
-                                 current, previous)
-            warnings = True
-        previous = current
+        iterator = (line.rstrip('\n') for line in file_obj)
+        try:
+            previous = next(iterator)
+        except StopIteration:
+            return warnings
+        for current in iterator:
+            gn_key = current.split('=', 1)[0]
+            if gn_key in keys_seen:
+                get_logger().warning('In GN flags %s, "%s" appears at least twice', gn_flags_path,
+                                     gn_key)
+                warnings = True
+            else:
+                keys_seen.add(gn_key)
+            if current < previous:
+                get_logger().warning('In GN flags %s, "%s" should be sorted before "%s"',
+                                     gn_flags_path, current, previous)
+                warnings = True
+            previous = current
     return warnings
 
 
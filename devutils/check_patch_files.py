@@ -17,6 +17,7 @@ Exit codes:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -27,7 +28,7 @@ from _common import ENCODING, get_logger, parse_series # pylint: disable=wrong-i
 sys.path.pop(0)
 
 # File suffixes to ignore for checking unused patches
-_PATCHES_IGNORE_SUFFIXES = {'.md'}
+_PATCHES_IGNORE_SUFFIXES = frozenset(('.md', ))
 
 
 def _read_series_file(patches_dir, series_file, join_dir=False):
@@ -80,12 +81,13 @@ def check_unused_patches(patches_dir, series_path=Path('series')):
     Returns True if there are unused patches; False otherwise.
     """
     unused_patches = set()
-    for path in patches_dir.rglob('*'):
-        if path.is_dir():
-            continue
-        if path.suffix in _PATCHES_IGNORE_SUFFIXES:
-            continue
-        unused_patches.add(str(path.relative_to(patches_dir)))
+    add_unused = unused_patches.add
+    # os.walk() already separates files from directories, so no stat is needed per entry
+    for dirpath, _, filenames in os.walk(str(patches_dir)):
+        for filename in filenames:
+            if os.path.splitext(filename)[1] in _PATCHES_IGNORE_SUFFIXES:
+                continue
+            add_unused(str(Path(dirpath, filename).relative_to(patches_dir)))
     unused_patches -= set(_read_series_file(patches_dir, series_path))
     unused_patches.remove(str(series_path))
     logger = get_logger()
@@ -15,7 +15,6 @@ import argparse
 import os
 import sys
 
-from itertools import repeat
 from multiprocessing import Pool
 from pathlib import Path, PurePosixPath
 
@@ -298,7 +297,7 @@ def compute_lists(source_tree, search_regex, processes): # pylint: disable=too-m
     with Pool(processes) as procpool:
         returned_data = procpool.starmap(
             compute_lists_proc,
-            zip(source_tree.rglob('*'), repeat(source_tree), repeat(search_regex)))
+            ((path, source_tree, search_regex) for path in source_tree.rglob('*')))
 
     # Handle the returned data
     for (used_pep_set, used_pip_set, used_dep_set, used_dip_set, returned_pruning_set,
@@ -321,6 +320,19 @@ def compute_lists(source_tree, search_regex, processes): # pylint: disable=too-m
     return sorted(pruning_set), sorted(domain_substitution_set), unused_patterns
 
 
+def _write_list(list_path, entries):
+    """
+    Writes a list file with one entry per line
+
+    list_path is a pathlib.Path to the list file to write
+    entries is a sequence of strings to write
+    """
+    with list_path.open('w', encoding=_ENCODING) as file_obj:
+        if entries:
+            file_obj.write('\n'.join(entries))
+            file_obj.write('\n')
+
+
 def main(args_list=None):
     """CLI entrypoint"""
     parser = argparse.ArgumentParser(description=__doc__)
@@ -373,10 +385,8 @@ def main(args_list=None):
     pruning_set, domain_substitution_set, unused_patterns = compute_lists(
         args.tree,
         DomainRegexList(args.domain_regex).search_regex, args.processes)
-    with args.pruning.open('w', encoding=_ENCODING) as file_obj:
-        file_obj.writelines('%s\n' % line for line in pruning_set)
-    with args.domain_substitution.open('w', encoding=_ENCODING) as file_obj:
-        file_obj.writelines('%s\n' % line for line in domain_substitution_set)
+    _write_list(args.pruning, pruning_set)
+    _write_list(args.domain_substitution, domain_substitution_set)
     if unused_patterns.log_unused(args.error_unused) and args.error_unused:
         get_logger().error('Please update or remove unused patterns and/or prefixes. '
                            'The lists have still been updated with the remaining valid entries.')
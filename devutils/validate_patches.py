@@ -79,6 +79,9 @@ except ImportError:
 _ROOT_DIR = Path(__file__).resolve().parent.parent
 _SRC_PATH = Path('src')
 
+# Sentinel for cached values that have not been computed yet
+_UNSET = object()
+
 
 class _PatchValidationError(Exception):
     """Raised when patch validation fails"""
@@ -272,14 +275,14 @@ class _FallbackRepoManager:
     _GN_REPO_URL = 'https://gn.googlesource.com/gn.git'
 
     def __init__(self):
-        self._cache_gn_version = None
+        self._cache_gn_version = _UNSET
 
     @property
     def gn_version(self):
         """
         Returns the version of the GN repo for the Chromium version used by this code
         """
-        if not self._cache_gn_version:
+        if self._cache_gn_version is _UNSET:
             # Because there seems to be no reference to the logic for generating the
             # chromium-browser-official tar file, it's possible that it is being generated
             # by an internal script that manually injects the GN repository files.
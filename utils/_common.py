@@ -6,6 +6,7 @@
 """Common code and constants"""
 import argparse
 import enum
+import functools
 import logging
 import platform
 from pathlib import Path
@@ -109,6 +110,7 @@ def get_running_platform():
     return PlatformEnum.UNIX
 
 
+@functools.lru_cache(maxsize=1)
 def get_chromium_version():
     """Returns the Chromium version."""
     return (Path(__file__).parent.parent / 'chromium_version.txt').read_text().strip()
@@ -116,19 +118,20 @@ def get_chromium_version():
 
 def parse_series(series_path):
     """
-    Returns an iterator of paths over the series file
+    Returns a tuple of the entries in the series file
 
     series_path is a pathlib.Path to the series file
     """
+    series_entries = []
     with series_path.open(encoding=ENCODING) as series_file:
-        series_lines = series_file.read().splitlines()
-    # Filter blank lines
-    series_lines = filter(len, series_lines)
-    # Filter comment lines
-    series_lines = filter((lambda x: not x.startswith('#')), series_lines)
-    # Strip in-line comments
-    series_lines = map((lambda x: x.strip().split(' #')[0]), series_lines)
-    return series_lines
+        for line in series_file:
+            line = line.rstrip('\n')
+            # Skip blank lines and comment lines
+            if not line or line.startswith('#'):
+                continue
+            # Strip in-line comments
+            series_entries.append(line.strip().partition(' #')[0])
+    return tuple(series_entries)
 
 
 def add_common_params(parser):
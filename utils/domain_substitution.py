@@ -12,6 +12,7 @@ from pathlib import Path
 import argparse
 import collections
 import contextlib
+import functools
 import io
 import os
 import stat
@@ -46,42 +47,49 @@ class DomainRegexList:
     def __init__(self, path):
         self._data = tuple(filter(len, path.read_text().splitlines()))
 
-        # Cache of compiled regex pairs
-        self._compiled_regex = None
-
     def _compile_regex(self, line):
         """Generates a regex pair tuple for the given line"""
-        pattern, replacement = line.split(self._PATTERN_REPLACE_DELIM)
-        return self._regex_pair_tuple(re.compile(pattern), replacement)
+        pattern, delimiter, replacement = line.partition(self._PATTERN_REPLACE_DELIM)
+        if not delimiter or self._PATTERN_REPLACE_DELIM in replacement:
+            raise ValueError(f'Domain regex line must contain exactly one '
+                             f'"{self._PATTERN_REPLACE_DELIM}" delimiter: {line}')
+        return self._regex_pair_tuple(_compile_pattern(pattern), replacement)
 
-    @property
+    @functools.cached_property
     def regex_pairs(self):
         """
         Returns a tuple of compiled regex pairs
         """
-        if not self._compiled_regex:
-            self._compiled_regex = tuple(map(self._compile_regex, self._data))
-        return self._compiled_regex
+        return tuple(self._compile_regex(line) for line in self._data)
 
-    @property
+    @functools.cached_property
     def search_regex(self):
         """
         Returns a single expression to search for domains
         """
-        return re.compile('|'.join(
-            map(lambda x: x.split(self._PATTERN_REPLACE_DELIM, 1)[0], self._data)))
+        return _compile_pattern('|'.join(
+            line.partition(self._PATTERN_REPLACE_DELIM)[0] for line in self._data))
 
 
 # Private Methods
 
 
-def _substitute_path(path, regex_iter):
+@functools.lru_cache(maxsize=4096)
+def _compile_pattern(pattern):
+    """
+    Returns the compiled regex for the pattern string.
+    Shared between DomainRegexList instances so identical patterns are only compiled once.
+    """
+    return re.compile(pattern)
+
+
+def _substitute_path(path, domain_regex):
     """
     Perform domain substitution on path and add it to the domain substitution cache.
 
     path is a pathlib.Path to the file to be domain substituted.
-    regex_iter is an iterable of regular expression namedtuple like from
-        config.DomainRegexList.regex_pairs()
+    domain_regex is the DomainRegexList to substitute with. Its regex pairs are only
+        tried individually if its search regex matches the file.
 
     Returns a tuple of the CRC32 hash of the substituted raw content and the
         original raw content; None for both entries if no substitutions were made.
@@ -107,8 +115,10 @@ def _substitute_path(path, regex_iter):
                 continue
         if not content:
             raise UnicodeDecodeError('Unable to decode with any encoding: %s' % path)
+        if domain_regex.search_regex.search(content) is None:
+            return (None, None)
         file_subs = 0
-        for regex_pair in regex_iter:
+        for regex_pair in domain_regex.regex_pairs:
             content, sub_count = regex_pair.pattern.subn(regex_pair.replacement, content)
             file_subs += sub_count
         if file_subs > 0:
@@ -157,6 +167,14 @@ def _validate_file_index(index_file, resolved_tree, cache_index_files):
     return all_hashes_valid
 
 
+def _add_bytes_to_tar(tar_obj, name, data):
+    """Adds the bytes data as a file with the given name to the tarfile.TarFile tar_obj"""
+    tarinfo = tarfile.TarInfo(name)
+    tarinfo.size = len(data)
+    with io.BytesIO(data) as data_file:
+        tar_obj.addfile(tarinfo, data_file)
+
+
 @contextlib.contextmanager
 def _update_timestamp(path: os.PathLike, set_new: bool) -> None:
     """
@@ -197,18 +215,18 @@ def apply_substitution(regex_path, files_path, source_tree, domainsub_cache):
     """
     if not source_tree.exists():
         raise FileNotFoundError(source_tree)
-    if not regex_path.exists():
-        raise FileNotFoundError(regex_path)
-    if not files_path.exists():
-        raise FileNotFoundError(files_path)
     if domainsub_cache and domainsub_cache.exists():
         raise FileExistsError(domainsub_cache)
     resolved_tree = source_tree.resolve()
-    regex_pairs = DomainRegexList(regex_path).regex_pairs
+    domain_regex = DomainRegexList(regex_path)
     fileindex_content = io.BytesIO()
-    with tarfile.open(str(domainsub_cache), 'w:%s' % domainsub_cache.suffix[1:],
-                      compresslevel=1) if domainsub_cache else open(os.devnull, 'w') as cache_tar:
-        for relative_path in filter(len, files_path.read_text().splitlines()):
+    with files_path.open(encoding=ENCODING) as files_file, tarfile.open(
+            str(domainsub_cache), 'w:%s' % domainsub_cache.suffix[1:],
+            compresslevel=1) if domainsub_cache else open(os.devnull, 'w') as cache_tar:
+        for relative_path in files_file:
+            relative_path = relative_path.rstrip('\n')
+            if not relative_path:
+                continue
             if _INDEX_HASH_DELIMITER in relative_path:
                 if domainsub_cache:
                     # Cache tar will be incomplete; remove it for convenience
@@ -225,22 +243,16 @@ def apply_substitution(regex_path, files_path, source_tree, domainsub_cache):
                 get_logger().warning('Skipping path that has become a symlink: %s', path)
                 continue
             with _update_timestamp(path, set_new=True):
-                crc32_hash, orig_content = _substitute_path(path, regex_pairs)
+                crc32_hash, orig_content = _substitute_path(path, domain_regex)
             if crc32_hash is None:
                 get_logger().info('Path has no substitutions: %s', relative_path)
                 continue
             if domainsub_cache:
                 fileindex_content.write('{}{}{:08x}\n'.format(relative_path, _INDEX_HASH_DELIMITER,
                                                               crc32_hash).encode(ENCODING))
-                orig_tarinfo = tarfile.TarInfo(str(Path(_ORIG_DIR) / relative_path))
-                orig_tarinfo.size = len(orig_content)
-                with io.BytesIO(orig_content) as orig_file:
-                    cache_tar.addfile(orig_tarinfo, orig_file)
+                _add_bytes_to_tar(cache_tar, str(Path(_ORIG_DIR) / relative_path), orig_content)
         if domainsub_cache:
-            fileindex_tarinfo = tarfile.TarInfo(_INDEX_LIST)
-            fileindex_tarinfo.size = fileindex_content.tell()
-            fileindex_content.seek(0)
-            cache_tar.addfile(fileindex_tarinfo, fileindex_content)
+            _add_bytes_to_tar(cache_tar, _INDEX_LIST, fileindex_content.getvalue())
 
 
 def revert_substitution(domainsub_cache, source_tree):
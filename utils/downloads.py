@@ -11,6 +11,7 @@ Module for the downloading, checking, and unpacking of necessary files into the
 import argparse
 import configparser
 import enum
+import functools
 import hashlib
 import shutil
 import ssl
@@ -29,6 +30,19 @@ sys.path.pop(0)
 
 # Constants
 
+# Keys of a downloads.ini section
+_NONEMPTY_KEYS = ('url', 'download_filename')
+_OPTIONAL_KEYS = (
+    'version',
+    'strip_leading_dirs',
+)
+# Keys of a downloads.ini section exposed as-is by the download properties
+_PASSTHROUGH_PROPERTIES = (*_NONEMPTY_KEYS, *_OPTIONAL_KEYS, 'extractor', 'output_path')
+
+# Keys of downloads.ini file sets that have already passed schema validation
+# See DownloadInfo._get_validation_key()
+_VALIDATED_INI_KEYS = set()
+
 
 class HashesURLEnum(str, enum.Enum):
     """Enum for supported hash URL schemes"""
@@ -44,12 +58,9 @@ class DownloadInfo: #pylint: disable=too-few-public-methods
 
     _hashes = ('md5', 'sha1', 'sha256', 'sha512')
     hash_url_delimiter = '|'
-    _nonempty_keys = ('url', 'download_filename')
-    _optional_keys = (
-        'version',
-        'strip_leading_dirs',
-    )
-    _passthrough_properties = (*_nonempty_keys, *_optional_keys, 'extractor', 'output_path')
+    _hash_url_processors = frozenset(x.value for x in HashesURLEnum)
+    _nonempty_keys = _NONEMPTY_KEYS
+    _optional_keys = _OPTIONAL_KEYS
     _ini_vars = {
         '_chromium_version': get_chromium_version(),
     }
@@ -57,51 +68,49 @@ class DownloadInfo: #pylint: disable=too-few-public-methods
     @staticmethod
     def _is_hash_url(value):
         return value.count(DownloadInfo.hash_url_delimiter) == 2 and value.split(
-            DownloadInfo.hash_url_delimiter)[0] in iter(HashesURLEnum)
-
-    _schema = schema.Schema({
-        schema.Optional(schema.And(str, len)): {
-            **{x: schema.And(str, len)
-               for x in _nonempty_keys},
-            'output_path': (lambda x: str(Path(x).relative_to(''))),
-            **{schema.Optional(x): schema.And(str, len)
-               for x in _optional_keys},
-            schema.Optional('extractor'): schema.Or(ExtractorEnum.TAR, ExtractorEnum.SEVENZIP,
-                                                    ExtractorEnum.WINRAR),
-            schema.Optional(schema.Or(*_hashes)): schema.And(str, len),
-            schema.Optional('hash_url'): lambda x: DownloadInfo._is_hash_url(x), #pylint: disable=unnecessary-lambda
-        }
-    })
+            DownloadInfo.hash_url_delimiter)[0] in DownloadInfo._hash_url_processors
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_schema(cls):
+        """Returns the schema for downloads.ini, which is only built on first use"""
+        return schema.Schema({
+            schema.Optional(schema.And(str, len)): {
+                **{x: schema.And(str, len)
+                   for x in cls._nonempty_keys},
+                'output_path': (lambda x: str(Path(x).relative_to(''))),
+                **{schema.Optional(x): schema.And(str, len)
+                   for x in cls._optional_keys},
+                schema.Optional('extractor'): schema.Or(ExtractorEnum.TAR, ExtractorEnum.SEVENZIP,
+                                                        ExtractorEnum.WINRAR),
+                schema.Optional(schema.Or(*cls._hashes)): schema.And(str, len),
+                schema.Optional('hash_url'): cls._is_hash_url,
+            }
+        })
 
     class _DownloadsProperties: #pylint: disable=too-few-public-methods
-        def __init__(self, section_dict, passthrough_properties, hashes):
-            self._section_dict = section_dict
-            self._passthrough_properties = passthrough_properties
-            self._hashes = hashes
+        __slots__ = (*_PASSTHROUGH_PROPERTIES, 'hashes')
+
+        def __init__(self, section_dict, hashes):
+            for name in _PASSTHROUGH_PROPERTIES:
+                setattr(self, name, section_dict.get(name, fallback=None))
+            self.hashes = {}
+            for hash_name in (*hashes, 'hash_url'):
+                value = section_dict.get(hash_name, fallback=None)
+                if value:
+                    if hash_name == 'hash_url':
+                        value = value.split(DownloadInfo.hash_url_delimiter)
+                    self.hashes[hash_name] = value
 
         def has_hash_url(self):
             """
             Returns a boolean indicating whether the current
             download has a hash URL"""
-            return 'hash_url' in self._section_dict
-
-        def __getattr__(self, name):
-            if name in self._passthrough_properties:
-                return self._section_dict.get(name, fallback=None)
-            if name == 'hashes':
-                hashes_dict = {}
-                for hash_name in (*self._hashes, 'hash_url'):
-                    value = self._section_dict.get(hash_name, fallback=None)
-                    if value:
-                        if hash_name == 'hash_url':
-                            value = value.split(DownloadInfo.hash_url_delimiter)
-                        hashes_dict[hash_name] = value
-                return hashes_dict
-            raise AttributeError('"{}" has no attribute "{}"'.format(type(self).__name__, name))
-
-    def _parse_data(self, path):
+            return 'hash_url' in self.hashes
+
+    def _validate_data(self, path, data):
         """
-        Parses an INI file located at path
+        Validates the ConfigParser data parsed from the INI file at path against the schema
 
         Raises schema.SchemaError if validation fails
         """
@@ -112,29 +121,65 @@ class DownloadInfo: #pylint: disable=too-few-public-methods
                 yield section, dict(
                     filter(lambda x: x[0] not in self._ini_vars, data.items(section)))
 
-        new_data = configparser.ConfigParser(defaults=self._ini_vars)
-        with path.open(encoding=ENCODING) as ini_file:
-            new_data.read_file(ini_file, source=str(path))
         try:
-            self._schema.validate(dict(_section_generator(new_data)))
+            self._get_schema().validate(dict(_section_generator(data)))
         except schema.SchemaError as exc:
             get_logger().error('downloads.ini failed schema validation (located in %s)', path)
             raise exc
+
+    @staticmethod
+    def _get_validation_key(ini_paths):
+        """
+        Returns a key identifying the current contents of the INI files at ini_paths
+        """
+        key = []
+        for path in ini_paths:
+            stat_result = path.stat()
+            key.append((str(path.absolute()), stat_result.st_mtime_ns, stat_result.st_size))
+        return tuple(key)
+
+    def _parse_data(self, ini_paths):
+        """
+        Parses the INI files located at ini_paths into a single ConfigParser
+
+        Each file is validated on its own, so every file must be valid by itself.
+        Schema validation is skipped if the same files were already validated unmodified.
+
+        Raises schema.SchemaError if validation fails
+        """
+        # The key must be computed before reading, so that a file modified after being read
+        # is not recorded as validated with the new modification time.
+        validation_key = self._get_validation_key(ini_paths)
+        validate = validation_key not in _VALIDATED_INI_KEYS
+        # Values are interpolated within their own file before merging, so the merged
+        # data must not be interpolated again.
+        new_data = configparser.ConfigParser(interpolation=None)
+        for path in ini_paths:
+            file_data = configparser.ConfigParser(defaults=self._ini_vars)
+            file_data.read_string(path.read_text(encoding=ENCODING), source=str(path))
+            if validate:
+                self._validate_data(path, file_data)
+            new_data.read_dict(file_data)
+        if validate:
+            _VALIDATED_INI_KEYS.add(validation_key)
         return new_data
 
     def __init__(self, ini_paths):
         """Reads an iterable of pathlib.Path to download.ini files"""
-        self._data = configparser.ConfigParser()
-        for path in ini_paths:
-            self._data.read_dict(self._parse_data(path))
+        self._data = self._parse_data(tuple(ini_paths))
+        # Cache of section name -> _DownloadsProperties
+        self._properties = {}
 
     def __getitem__(self, section):
         """
         Returns an object with keys as attributes and
         values already pre-processed strings
         """
-        return self._DownloadsProperties(self._data[section], self._passthrough_properties,
-                                         self._hashes)
+        properties = self._properties.get(section)
+        if properties is None:
+            properties = self._DownloadsProperties(self._data[section], self._hashes)
+            self._properties[section] = properties
+        return properties
 
     def __contains__(self, item):
         """
@@ -25,10 +25,6 @@ def make_domain_substitution_script(regex_path, files_path, output_path):
     Raises FileNotFoundError if the regex or file lists do not exist.
     Raises FileExistsError if the output file already exists.
     """
-    if not regex_path.exists():
-        raise FileNotFoundError(regex_path)
-    if not files_path.exists():
-        raise FileNotFoundError(files_path)
     if output_path.exists():
         raise FileExistsError(output_path)
 
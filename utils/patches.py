@@ -7,6 +7,7 @@
 """Applies unified diff patches"""
 
 import argparse
+import concurrent.futures
 import os
 import shutil
 import subprocess
@@ -149,9 +150,20 @@ def generate_patches_from_series(patches_dir, resolve=False):
 
 def _copy_files(path_iter, source, destination):
     """Copy files from source to destination with relative paths from path_iter"""
+    created_dirs = set()
+    source_paths = []
+    destination_paths = []
     for path in path_iter:
-        (destination / path).parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(source / path), str(destination / path))
+        destination_path = destination / path
+        if destination_path.parent not in created_dirs:
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(destination_path.parent)
+        source_paths.append(source / path)
+        destination_paths.append(destination_path)
+    # Copying is I/O bound, so the copies can overlap in threads
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        # Consume the results to raise any exception from copying
+        tuple(executor.map(shutil.copy2, source_paths, destination_paths))
 
 
 def merge_patches(source_iter, destination, prepend=False):
@@ -161,6 +173,7 @@ def merge_patches(source_iter, destination, prepend=False):
     destination must not already exist, unless prepend is True. If prepend is True, then
     the source patches will be prepended to the destination.
     """
+    source_dirs = tuple(source_iter)
     series = []
     known_paths = set()
     if destination.exists():
@@ -172,7 +185,7 @@ def merge_patches(source_iter, destination, prepend=False):
             known_paths.update(generate_patches_from_series(destination))
         else:
             raise FileExistsError('destination already exists: {}'.format(destination))
-    for source_dir in source_iter:
+    for source_dir in source_dirs:
         patch_paths = tuple(generate_patches_from_series(source_dir))
         patch_intersection = known_paths.intersection(patch_paths)
         if patch_intersection:
@@ -180,9 +193,14 @@ def merge_patches(source_iter, destination, prepend=False):
                 'Patches from {} have conflicting paths with other sources: {}'.format(
                     source_dir, patch_intersection))
         series.extend(patch_paths)
+        known_paths.update(patch_paths)
         _copy_files(patch_paths, source_dir, destination)
     if prepend and (destination / 'series').exists():
         series.extend(generate_patches_from_series(destination))
+    elif len(source_dirs) == 1:
+        # Nothing was merged, so the series file of the only source can be used as-is
+        shutil.copyfile(source_dirs[0] / 'series', destination / 'series')
+        return
     with (destination / 'series').open('w') as series_file:
         series_file.write('\n'.join(map(str, series)))
 
@@ -109,8 +109,9 @@ def _callback(args):
     if not args.pruning_list.exists():
         get_logger().error('Could not find the pruning list: %s', args.pruning_list)
     prune_dirs(args.directory)
-    prune_list = tuple(filter(len, args.pruning_list.read_text(encoding=ENCODING).splitlines()))
-    unremovable_files = prune_files(args.directory, prune_list)
+    with args.pruning_list.open(encoding=ENCODING) as prune_file:
+        prune_list = filter(len, (line.rstrip('\n') for line in prune_file))
+        unremovable_files = prune_files(args.directory, prune_list)
     if unremovable_files:
         get_logger().error('%d files could not be pruned.', len(unremovable_files))
         get_logger().debug('Files could not be pruned:\n%s',
@@ -8,6 +8,8 @@ import os
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from .. import domain_substitution
 
 
@@ -34,3 +36,36 @@ def test_update_timestamp():
         new_stats: os.stat_result = path.stat()
         assert orig_stats.st_atime_ns == new_stats.st_atime_ns
         assert orig_stats.st_mtime_ns == new_stats.st_mtime_ns
+
+
+def test_substitute_path():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        regex_path = Path(tmpdirname, 'domain_regex.list')
+        regex_path.write_text('\n'.join([
+            r'google([A-Za-z\-]*?\\*?)\.com#9oo91e\g<1>.qjz9zk',
+            r'goo\.gl(e?)#goo.gl\g<1>.qjz9zk',
+        ]))
+        domain_regex = domain_substitution.DomainRegexList(regex_path)
+
+        # File with domains to substitute
+        path = Path(tmpdirname, 'substituted.cc')
+        path.write_text('https://www.google.com/ https://goo.gl/\n')
+        crc32_hash, orig_content = domain_substitution._substitute_path(path, domain_regex)
+        assert crc32_hash is not None
+        assert orig_content == b'https://www.google.com/ https://goo.gl/\n'
+        assert path.read_text() == 'https://www.9oo91e.qjz9zk/ https://goo.gl.qjz9zk/\n'
+
+        # File without domains to substitute
+        path = Path(tmpdirname, 'unchanged.cc')
+        path.write_text('https://example.com/\n')
+        assert domain_substitution._substitute_path(path, domain_regex) == (None, None)
+        assert path.read_text() == 'https://example.com/\n'
+
+
+def test_domain_regex_list_delimiter():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        regex_path = Path(tmpdirname, 'domain_regex.list')
+        for line in ('foo', 'foo#bar#baz'):
+            regex_path.write_text(line)
+            with pytest.raises(ValueError):
+                domain_substitution.DomainRegexList(regex_path).regex_pairs
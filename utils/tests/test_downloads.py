@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2026 The ungoogled-chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import logging
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from .. import downloads
+
+_BASE_INI = """
+[foo]
+version = 1.0
+url = https://example.com/foo-%(version)s.tar.xz
+download_filename = foo-%(version)s.tar.xz
+strip_leading_dirs = foo-%(version)s
+output_path = third_party/foo
+sha512 = aaaa
+"""
+
+_OVERRIDE_INI = """
+[foo]
+version = 2.0
+url = https://example.com/foo-%(version)s.tar.xz
+download_filename = foo-%(version)s.tar.xz
+output_path = third_party/foo
+sha512 = bbbb
+"""
+
+
+def test_multiple_ini_files():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        base_path = Path(tmpdirname, 'base.ini')
+        base_path.write_text(_BASE_INI)
+        override_path = Path(tmpdirname, 'override.ini')
+        override_path.write_text(_OVERRIDE_INI)
+
+        download_info = downloads.DownloadInfo((base_path, override_path))
+        assert list(download_info) == ['foo']
+        assert download_info['foo'].url == 'https://example.com/foo-2.0.tar.xz'
+        assert download_info['foo'].hashes == {'sha512': 'bbbb'}
+        # Values are interpolated within the file that defines them
+        assert download_info['foo'].strip_leading_dirs == 'foo-1.0'
+
+
+def test_partial_ini_file(caplog):
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        base_path = Path(tmpdirname, 'base.ini')
+        base_path.write_text(_BASE_INI)
+        override_path = Path(tmpdirname, 'override.ini')
+        override_path.write_text(_OVERRIDE_INI)
+        # Every file must be valid on its own, even when overriding another file
+        partial_path = Path(tmpdirname, 'partial.ini')
+        partial_path.write_text('[foo]\nsha512 = cccc\n')
+
+        with caplog.at_level(logging.ERROR):
+            with pytest.raises(downloads.schema.SchemaError):
+                downloads.DownloadInfo((base_path, override_path, partial_path))
+        assert str(partial_path) in caplog.text
+        assert str(base_path) not in caplog.text
+        assert str(override_path) not in caplog.text
+
+
+def test_ini_interpolation():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        ini_path = Path(tmpdirname, 'downloads.ini')
+        ini_path.write_text('\n'.join([
+            '[foo]',
+            'url = https://example.com/foo-%(_chromium_version)s.tar.xz?a=1%%20',
+            'download_filename = foo.tar.xz',
+            'output_path = third_party/foo',
+        ]))
+
+        download_info = downloads.DownloadInfo((ini_path, ))
+        assert download_info['foo'].url == 'https://example.com/foo-{}.tar.xz?a=1%20'.format(
+            downloads.get_chromium_version())
@@ -7,6 +7,7 @@
 from pathlib import Path
 import os
 import shutil
+import tempfile
 
 import pytest
 
@@ -38,3 +39,24 @@ def test_patch_from_env():
 
     del os.environ['PATCH_BIN']
     assert patches._find_patch_from_env() is None
+
+
+def test_merge_patches():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname)
+        for source_name, patch_names in (('a', ('a.patch', 'common.patch')), ('b', ('b.patch', )),
+                                         ('c', ('common.patch', ))):
+            (tmpdir / source_name).mkdir()
+            (tmpdir / source_name / 'series').write_text('\n'.join(patch_names))
+            for patch_name in patch_names:
+                (tmpdir / source_name / patch_name).write_text(source_name)
+
+        patches.merge_patches((tmpdir / 'a', tmpdir / 'b'), tmpdir / 'merged')
+        assert list(patches.generate_patches_from_series(tmpdir / 'merged')) == [
+            'a.patch', 'common.patch', 'b.patch'
+        ]
+        assert (tmpdir / 'merged' / 'b.patch').read_text() == 'b'
+
+        # Sources with the same patch paths conflict
+        with pytest.raises(FileExistsError):
+            patches.merge_patches((tmpdir / 'a', tmpdir / 'c'), tmpdir / 'conflict')